@@ -1,23 +1,5 @@
 import sys
 import os
-from .pipeline_steps import *
-
-# from .pipeline_steps.Plotting_Steps import Plot_Galaxy_Image
-# from .pipeline_steps.Background import Background_Mode, Background_DilatedSources, Background_Unsharp, Background_Basic
-# from .pipeline_steps.PSF import PSF_IRAF, PSF_StarFind, PSF_Image, PSF_deconvolve
-# from .pipeline_steps.Center import Center_2DGaussian, Center_1DGaussian, Center_OfMass, Center_HillClimb, Center_Forced, Center_HillClimb_mean
-# from .pipeline_steps.Isophote_Initialize import Isophote_Initialize, Isophote_Initialize_mean, Isophote_Init_Forced
-# from .pipeline_steps.Isophote_Fit import Isophote_Fit_FFT_Robust, Isophote_Fit_Forced, Photutils_Fit, Isophote_Fit_FFT_mean, Isophote_Fit_FixedPhase
-# from .pipeline_steps.Mask import Star_Mask_IRAF, Mask_Segmentation_Map, Bad_Pixel_Mask, Star_Mask
-# from .pipeline_steps.Isophote_Extract import Isophote_Extract, Isophote_Extract_Forced, Isophote_Extract_Photutils
-# from .pipeline_steps.Check_Fit import Check_Fit
-# from .pipeline_steps.Write_Prof import WriteProf
-# from .pipeline_steps.Write_Fi import WriteFi
-# from .pipeline_steps.Ellipse_Model import EllipseModel
-# from .pipeline_steps.Radial_Profiles import Radial_Profiles
-# from .pipeline_steps.Axial_Profiles import Axial_Profiles
-# from .pipeline_steps.Slice_Profiles import Slice_Profile
-from .autoprofutils.ImageTransform import Crop
 from .autoprofutils.SharedFunctions import GetOptions, Read_Image, PA_shift_convention
 from multiprocessing import Pool, current_process
 from astropy.io import fits
@@ -26,7 +8,7 @@ from itertools import starmap
 from functools import partial
 import importlib
 import numpy as np
-from time import time, sleep
+from time import time
 import logging
 import warnings
 import traceback
@@ -35,6 +17,38 @@ from astropy.io.fits.verify import VerifyWarning
 warnings.simplefilter("ignore", category=VerifyWarning)
 
 
+def _seed_worker_rng():
+    """
+    Pool worker initializer. Seeds numpy's random number generator once per
+    worker process so that parallel images don't share correlated random
+    streams.
+    """
+    np.random.seed(int((current_process().pid * int(time() * 1e6)) % 2**32))
+
+
+# Pipeline object reconstructed once per pool worker by _initialize_worker,
+# so that each task only ships its per-image options dict instead of pickling
+# the whole pipeline with every task
+_WORKER_PIPELINE = None
+
+
+def _initialize_worker(state):
+    """
+    Pool worker initializer. Rebuilds the pipeline once from the parent's
+    state and seeds the random number generator for this worker.
+    """
+    global _WORKER_PIPELINE
+    _seed_worker_rng()
+    _WORKER_PIPELINE = Isophote_Pipeline._from_state(state)
+
+
+def _run_worker(options):
+    """
+    Pool task function, runs one image through the worker's pipeline.
+    """
+    return _WORKER_PIPELINE.Process_Image(options)
+
+
 class Isophote_Pipeline(object):
 
     def __init__(self, loggername=None):
@@ -44,47 +58,49 @@ class Isophote_Pipeline(object):
         loggername: String to use for logging messages
         """
 
-        # Functions avaiable by default for building the pipeline
+        # Functions avaiable by default for building the pipeline. Stored as
+        # (module, function) pairs and imported on first use so that only the
+        # steps actually configured pull in their dependencies, see _get_method
         self.pipeline_methods = {
-            "background": Background_Mode,
-            "background dilatedsources": Background_DilatedSources,
-            "background unsharp": Background_Unsharp,
-            "background basic": Background_Basic,
-            "psf": PSF_Assumed,
-            "psf starfind": PSF_StarFind,
-            "psf IRAF": PSF_IRAF,
-            "psf img": PSF_Image,
-            "psf deconvolve": PSF_deconvolve,
-            "center": Center_HillClimb,
-            "center mean": Center_HillClimb_mean,
-            "center forced": Center_Forced,
-            "center 2DGaussian": Center_2DGaussian,
-            "center 1DGaussian": Center_1DGaussian,
-            "center OfMass": Center_OfMass,
-            "crop": Crop,
-            "isophoteinit": Isophote_Initialize,
-            "isophoteinit forced": Isophote_Init_Forced,
-            "isophoteinit mean": Isophote_Initialize_mean,
-            "plot image": Plot_Galaxy_Image,
-            "writefi": WriteFi,
-            "isophotefit": Isophote_Fit_FFT_Robust,
-            "isophotefit fixed": Isophote_Fit_FixedPhase,
-            "isophotefit mean": Isophote_Fit_FFT_mean,
-            "isophotefit forced": Isophote_Fit_Forced,
-            "isophotefit photutils": Photutils_Fit,
-            "mask badpixels": Bad_Pixel_Mask,
-            "starmask": Star_Mask,
-            "starmask IRAF": Star_Mask_IRAF,
-            "mask segmentation map": Mask_Segmentation_Map,
-            "isophoteextract": Isophote_Extract,
-            "isophoteextract photutils": Isophote_Extract_Photutils,
-            "isophoteextract forced": Isophote_Extract_Forced,
-            "checkfit": Check_Fit,
-            "writeprof": WriteProf,
-            "ellipsemodel": EllipseModel,
-            "radialprofiles": Radial_Profiles,
-            "sliceprofile": Slice_Profile,
-            "axialprofiles": Axial_Profiles,
+            "background": ("pipeline_steps.Background", "Background_Mode"),
+            "background dilatedsources": ("pipeline_steps.Background", "Background_DilatedSources"),
+            "background unsharp": ("pipeline_steps.Background", "Background_Unsharp"),
+            "background basic": ("pipeline_steps.Background", "Background_Basic"),
+            "psf": ("pipeline_steps.PSF", "PSF_Assumed"),
+            "psf starfind": ("pipeline_steps.PSF", "PSF_StarFind"),
+            "psf IRAF": ("pipeline_steps.PSF", "PSF_IRAF"),
+            "psf img": ("pipeline_steps.PSF", "PSF_Image"),
+            "psf deconvolve": ("pipeline_steps.PSF", "PSF_deconvolve"),
+            "center": ("pipeline_steps.Center", "Center_HillClimb"),
+            "center mean": ("pipeline_steps.Center", "Center_HillClimb_mean"),
+            "center forced": ("pipeline_steps.Center", "Center_Forced"),
+            "center 2DGaussian": ("pipeline_steps.Center", "Center_2DGaussian"),
+            "center 1DGaussian": ("pipeline_steps.Center", "Center_1DGaussian"),
+            "center OfMass": ("pipeline_steps.Center", "Center_OfMass"),
+            "crop": ("autoprofutils.ImageTransform", "Crop"),
+            "isophoteinit": ("pipeline_steps.Isophote_Initialize", "Isophote_Initialize"),
+            "isophoteinit forced": ("pipeline_steps.Isophote_Initialize", "Isophote_Init_Forced"),
+            "isophoteinit mean": ("pipeline_steps.Isophote_Initialize", "Isophote_Initialize_mean"),
+            "plot image": ("pipeline_steps.Plotting_Steps", "Plot_Galaxy_Image"),
+            "writefi": ("pipeline_steps.Write_Fi", "WriteFi"),
+            "isophotefit": ("pipeline_steps.Isophote_Fit", "Isophote_Fit_FFT_Robust"),
+            "isophotefit fixed": ("pipeline_steps.Isophote_Fit", "Isophote_Fit_FixedPhase"),
+            "isophotefit mean": ("pipeline_steps.Isophote_Fit", "Isophote_Fit_FFT_mean"),
+            "isophotefit forced": ("pipeline_steps.Isophote_Fit", "Isophote_Fit_Forced"),
+            "isophotefit photutils": ("pipeline_steps.Isophote_Fit", "Photutils_Fit"),
+            "mask badpixels": ("pipeline_steps.Mask", "Bad_Pixel_Mask"),
+            "starmask": ("pipeline_steps.Mask", "Star_Mask"),
+            "starmask IRAF": ("pipeline_steps.Mask", "Star_Mask_IRAF"),
+            "mask segmentation map": ("pipeline_steps.Mask", "Mask_Segmentation_Map"),
+            "isophoteextract": ("pipeline_steps.Isophote_Extract", "Isophote_Extract"),
+            "isophoteextract photutils": ("pipeline_steps.Isophote_Extract", "Isophote_Extract_Photutils"),
+            "isophoteextract forced": ("pipeline_steps.Isophote_Extract", "Isophote_Extract_Forced"),
+            "checkfit": ("pipeline_steps.Check_Fit", "Check_Fit"),
+            "writeprof": ("pipeline_steps.Write_Prof", "WriteProf"),
+            "ellipsemodel": ("pipeline_steps.Ellipse_Model", "EllipseModel"),
+            "radialprofiles": ("pipeline_steps.Radial_Profiles", "Radial_Profiles"),
+            "sliceprofile": ("pipeline_steps.Slice_Profiles", "Slice_Profile"),
+            "axialprofiles": ("pipeline_steps.Axial_Profiles", "Axial_Profiles"),
         }
 
         # Default pipeline analysis order
@@ -108,6 +124,38 @@ class Isophote_Pipeline(object):
             filemode="w",
         )
 
+    def _state(self):
+        """
+        Picklable snapshot of the pipeline configuration, used to rebuild the
+        pipeline inside pool workers.
+        """
+        return (self.pipeline_methods, self.pipeline_steps)
+
+    @classmethod
+    def _from_state(cls, state):
+        """
+        Rebuild a pipeline from a _state snapshot, skipping __init__ so the
+        worker does not reconfigure logging.
+        """
+        pipeline = cls.__new__(cls)
+        pipeline.pipeline_methods, pipeline.pipeline_steps = state
+        return pipeline
+
+    def _get_method(self, step):
+        """
+        Resolve a pipeline method name to its callable. Default methods are
+        stored as (module, function) pairs and only imported the first time
+        they are needed, the resolved function is cached back into
+        pipeline_methods. Methods supplied through UpdatePipeline are already
+        callables and pass through unchanged.
+        """
+        method = self.pipeline_methods[step]
+        if isinstance(method, tuple):
+            module = importlib.import_module("." + method[0], package=__package__)
+            method = getattr(module, method[1])
+            self.pipeline_methods[step] = method
+        return method
+
     def UpdatePipeline(self, new_pipeline_methods=None, new_pipeline_steps=None):
         """
         modify steps in the AutoProf pipeline.
@@ -146,15 +194,6 @@ class Isophote_Pipeline(object):
             if options[key] is None:
                 del options[key]
 
-        # Seed the random number generator in numpy so each thread gets unique random numbers
-        try:
-            sleep(0.01)
-            np.random.seed(
-                int(np.random.randint(10000) * current_process().pid * (time() % 1) % 2**15)
-            )
-        except:
-            pass
-
         # use filename if no name is given
         if not ("ap_name" in options and type(options["ap_name"]) == str):
             base = os.path.split(options["ap_image_file"])[1]
@@ -169,14 +208,11 @@ class Isophote_Pipeline(object):
             )
             return 1
 
-        # Check that image data exists and is not corrupted
-        if dat is None or np.all(
-            dat[
-                int(len(dat) / 2.0) - 10 : int(len(dat) / 2.0) + 10,
-                int(len(dat[0]) / 2.0) - 10 : int(len(dat[0]) / 2.0) + 10,
-            ]
-            == 0
-        ):
+        # Check that image data exists and is not corrupted. any() short
+        # circuits on the first non-zero pixel of the center patch, a fully
+        # zero patch indicates a large chunk of missing data
+        cy, cx = (0, 0) if dat is None else (dat.shape[0] // 2, dat.shape[1] // 2)
+        if dat is None or not dat[cy - 10 : cy + 10, cx - 10 : cx + 10].any():
             logging.error(
                 "%s Large chunk of data missing, impossible to process image" % options["ap_name"]
             )
@@ -202,7 +238,7 @@ class Isophote_Pipeline(object):
                     % (options["ap_name"], key, self.pipeline_steps[key][step], time() - start)
                 )
                 if "branch" in self.pipeline_steps[key][step]:
-                    decision, newoptions = self.pipeline_methods[self.pipeline_steps[key][step]](
+                    decision, newoptions = self._get_method(self.pipeline_steps[key][step])(
                         dat, results, options
                     )
                     options.update(newoptions)
@@ -213,7 +249,7 @@ class Isophote_Pipeline(object):
                         step += 1
                 else:
                     step_start = time()
-                    dat, res = self.pipeline_methods[self.pipeline_steps[key][step]](
+                    dat, res = self._get_method(self.pipeline_steps[key][step])(
                         dat, results, options
                     )
                     results.update(res)
@@ -243,30 +279,39 @@ class Isophote_Pipeline(object):
         assert type(options["ap_image_file"]) == list
 
         # Format the inputs so that they can be zipped with the images files
-        # and passed to the Process_Image function.
+        # and passed to the Process_Image function. The options are split
+        # once into shared scalars and per-image lists, so building each
+        # image's options is a plain dict copy plus the few list entries
+        # instead of a full key scan per image.
+        list_keys = list(
+            k for k in options if type(options[k]) == list and not k in ["ap_new_pipeline_steps"]
+        )
+        shared_options = dict((k, options[k]) for k in options if not k in list_keys)
         use_options = []
         for i in range(len(options["ap_image_file"])):
-            tmp_options = {}
-            for k in options.keys():
-                if type(options[k]) == list and not k in ["ap_new_pipeline_steps"]:
-                    tmp_options[k] = options[k][i]
-                else:
-                    tmp_options[k] = options[k]
+            tmp_options = dict(shared_options)
+            tmp_options.update((k, options[k][i]) for k in list_keys)
             use_options.append(tmp_options)
         # Track how long it takes to run the analysis
         start = time()
 
-        # Create a multiprocessing pool to parallelize image processing
-        n_procs = options["ap_n_procs"] if "ap_n_procs" in options else 1
-        if n_procs > 1:
-            with Pool(int(n_procs)) as pool:
-                res = pool.map(
-                    self.Process_Image,
-                    use_options,
-                    chunksize=5 if len(options["ap_image_file"]) > 100 else 1,
-                )
-        else:
+        # Create a multiprocessing pool to parallelize image processing. The
+        # pool is skipped entirely for trivial jobs since fork/pickle overhead
+        # dominates when there is only one image or process.
+        n_procs = int(options["ap_n_procs"]) if "ap_n_procs" in options else 1
+        if n_procs <= 1 or len(use_options) == 1:
             res = list(map(self.Process_Image, use_options))
+        else:
+            # the pipeline is shipped to each worker once through the
+            # initializer, so each task only pickles its options dict
+            with Pool(n_procs, initializer=_initialize_worker, initargs=(self._state(),)) as pool:
+                res = list(
+                    pool.imap_unordered(
+                        _run_worker,
+                        use_options,
+                        chunksize=max(1, len(use_options) // (4 * n_procs)),
+                    )
+                )
 
         # Report completed processing, and track time used
         logging.info("All Images Finished Processing at %.1f" % (time() - start))
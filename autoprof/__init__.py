@@ -1,7 +1,19 @@
 import os
 import sys
+import importlib
+
+# Submodules are imported lazily (PEP 562) so that "import autoprof" stays
+# cheap; the heavy scientific stack only loads once the pipeline is built
+_SUBMODULES = ("autoprofutils", "Pipeline", "pipeline_steps")
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module("." + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
-from . import autoprofutils, Pipeline, pipeline_steps
 
 try:
     from ._version import version as __version__  # noqa
@@ -36,6 +48,8 @@ def run_from_terminal():
     except:
         logfile = None
 
+    from . import Pipeline
+
     PIPELINE = Pipeline.Isophote_Pipeline(loggername=logfile)
 
     PIPELINE.Process_ConfigFile(config_file)
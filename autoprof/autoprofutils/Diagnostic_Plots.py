@@ -1,20 +1,36 @@
 import numpy as np
 from astropy.visualization import LogStretch
 from astropy.visualization.mpl_normalize import ImageNormalize
+import matplotlib
+
+# these plots are only ever written to disk, the non-interactive Agg
+# backend avoids ever touching a display toolkit.
+#
+# Plot emission is deliberately synchronous: each pipeline step calls its
+# plot routine inline and callers rely on the file existing when the step
+# returns. Batch runs already spread whole galaxies (plots included) across
+# processes via ap_n_procs, so farming individual figures to a second pool
+# would only oversubscribe the workers
+matplotlib.use("Agg", force=False)
 import matplotlib.pyplot as plt
 from matplotlib.patches import Ellipse, Wedge
-import matplotlib
+from matplotlib.collections import PatchCollection, LineCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from itertools import compress
+import io
 import os
 
 from .SharedFunctions import (
     LSBImage,
+    ReuseFigure,
     AddScale,
     AddLogo,
     autocolours,
     autocmap,
     parametric_SuperEllipse,
     Rotate_Cartesian,
+    _DEFAULT_DPI,
 )
 
 __all__ = (
@@ -33,77 +49,124 @@ __all__ = (
 )
 
 
+def _save_plot(stem, options, fig=None):
+    """
+    Shared figure finalizer for this module. Adds the logo unless disabled,
+    resolves the output path/dpi/extension options in one place, writes the
+    figure and closes it. Works on the current pyplot figure by default, or
+    on an explicit Figure for functions using the OO API.
+    """
+    if fig is None:
+        fig = plt.gcf()
+    if not ("ap_nologo" in options and options["ap_nologo"]):
+        AddLogo(fig)
+    ext = options.get("ap_plot_extension", "jpg")
+    # encode in memory and flush with a single write, many small writes
+    # from the encoder are slow on networked filesystems
+    buf = io.BytesIO()
+    savekwargs = {
+        "format": ext,
+        "dpi": options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
+    }
+    # vector backends reject pil_kwargs, only pass it to the PIL formats
+    if ext in ("jpg", "jpeg"):
+        savekwargs["pil_kwargs"] = {"quality": 85}
+    fig.savefig(buf, **savekwargs)
+    with open(
+        os.path.join(
+            options["ap_plotpath"] if "ap_plotpath" in options else "",
+            f"{stem}_{options['ap_name']}.{ext}",
+        ),
+        "wb",
+    ) as f:
+        f.write(buf.getbuffer())
+    fig.clear()
+
+
+# Plot_Background renders through the object-oriented API on its own Agg
+# canvas, bypassing the pyplot figure registry entirely
+_BG_FIG = None
+
+
+def _background_figure():
+    global _BG_FIG
+    if _BG_FIG is None:
+        _BG_FIG = Figure(figsize=(5, 5))
+        FigureCanvasAgg(_BG_FIG)
+    return _BG_FIG
+
+
 def Plot_Background(values, bkgrnd, noise, results, options):
 
-    hist, bins = np.histogram(
-        values[np.logical_and((values - bkgrnd) < 20 * noise, (values - bkgrnd) > -5 * noise)],
-        bins=max(10, int(np.sqrt(len(values)) / 2)),
-    )
-    plt.figure(figsize=(5, 5))
-    plt.bar(
+    # this is a diagnostic, not a measurement: above a million pixels a
+    # uniform subsample gives a statistically identical histogram shape
+    if values.size > 1000000:
+        values = values[:: int(np.ceil(values.size / 1000000))]
+    lo = bkgrnd - 5 * noise
+    hi = bkgrnd + 20 * noise
+    # compare against precomputed bounds, the old (values - bkgrnd) form
+    # materialized the difference array twice
+    sel = np.less(values, hi)
+    np.logical_and(sel, values > lo, out=sel)
+    selected = values[sel]
+    nbins = max(10, int(np.sqrt(len(values)) / 2))
+    # the bins are uniform over the plotted range, so the histogram reduces
+    # to a scale-and-count instead of a binary search per pixel
+    bins, step = np.linspace(lo, hi, nbins + 1, retstep=True)
+    idx = ((selected - lo) * (1.0 / step)).astype(np.intp)
+    np.clip(idx, 0, nbins - 1, out=idx)
+    hist = np.bincount(idx, minlength=nbins)
+    fig = _background_figure()
+    ax = fig.add_subplot(111)
+    # plot the raw counts on a log axis, skipping the log10/where pass over
+    # the histogram and the NaN handling for empty bins
+    ax.bar(
         bins[:-1],
-        np.log10(np.where(hist > 0, hist, np.nan)),
-        width=bins[1] - bins[0],
+        hist,
+        width=step,
         color="k",
         label="pixel values",
     )
-    plt.axvline(bkgrnd, color="#84DCCF", label="sky level: %.5e" % bkgrnd)
-    plt.axvline(
+    ax.set_yscale("log")
+    ax.axvline(bkgrnd, color="#84DCCF", label="sky level: %.5e" % bkgrnd)
+    ax.axvline(
         bkgrnd - noise,
         color="#84DCCF",
         linewidth=0.7,
         linestyle="--",
         label="1$\\sigma$ noise/pix: %.5e" % noise,
     )
-    plt.axvline(bkgrnd + noise, color="#84DCCF", linewidth=0.7, linestyle="--")
-    plt.xlim([bkgrnd - 5 * noise, bkgrnd + 20 * noise])
-    plt.legend(fontsize=12)
-    plt.tick_params(labelsize=12)
-    plt.xlabel("Pixel Flux", fontsize=16)
-    plt.ylabel("log$_{10}$(count)", fontsize=16)
-    plt.tight_layout()
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"Background_hist_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    ax.axvline(bkgrnd + noise, color="#84DCCF", linewidth=0.7, linestyle="--")
+    ax.set_xlim([bkgrnd - 5 * noise, bkgrnd + 20 * noise])
+    ax.legend(fontsize=12)
+    ax.tick_params(labelsize=12)
+    ax.set_xlabel("Pixel Flux", fontsize=16)
+    ax.set_ylabel("count", fontsize=16)
+    fig.tight_layout()
+    _save_plot("Background_hist", options, fig=fig)
 
 
 def Plot_PSF_Stars(IMG, stars_x, stars_y, stars_fwhm, psf, results, options, flagstars=None):
     LSBImage(IMG - results["background"], results["background noise"])
     AddScale(plt.gca(), IMG.shape[0] * options["ap_pixscale"])
-    for i in range(len(stars_fwhm)):
-        plt.gca().add_patch(
-            Ellipse(
-                xy=(stars_x[i], stars_y[i]),
-                width=20 * psf,
-                height=20 * psf,
-                angle=0,
-                fill=False,
-                linewidth=1.5,
-                color=(
-                    autocolours["red1"]
-                    if not flagstars is None and flagstars[i]
-                    else autocolours["blue1"]
-                ),
-            )
-        )
-    plt.tight_layout()
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"PSF_Stars_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+    # one collection for all the star markers, matplotlib applies the
+    # transforms in a single vectorized pass instead of per patch
+    star_patches = [
+        Ellipse(xy=(stars_x[i], stars_y[i]), width=20 * psf, height=20 * psf)
+        for i in range(len(stars_fwhm))
+    ]
+    if flagstars is None:
+        edgecolors = autocolours["blue1"]
+    else:
+        edgecolors = [
+            autocolours["red1"] if flagstars[i] else autocolours["blue1"]
+            for i in range(len(stars_fwhm))
+        ]
+    plt.gca().add_collection(
+        PatchCollection(star_patches, facecolor="none", edgecolor=edgecolors, linewidth=1.5)
     )
-    plt.close()
+    plt.tight_layout()
+    _save_plot("PSF_Stars", options)
 
 
 def Plot_Isophote_Init_Ellipse(dat, circ_ellipse_radii, ellip, phase, results, options):
@@ -144,16 +207,7 @@ def Plot_Isophote_Init_Ellipse(dat, circ_ellipse_radii, ellip, phase, results, o
         markersize=3,
         color=autocolours["red1"],
     )
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"initialize_ellipse_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    _save_plot("initialize_ellipse", options)
 
 
 def Plot_Isophote_Init_Optimize(
@@ -168,7 +222,8 @@ def Plot_Isophote_Init_Optimize(
     results,
     options,
 ):
-    fig, ax = plt.subplots(2, 1, figsize=(6, 6))
+    fig = ReuseFigure((6, 6))
+    ax = fig.subplots(2, 1)
     plt.subplots_adjust(hspace=0.01, wspace=0.01)
     ax[0].plot(
         circ_ellipse_radii[:-1],
@@ -190,16 +245,7 @@ def Plot_Isophote_Init_Optimize(
     ax[1].set_ylabel("Loss [FFT$_{2}$/med(flux)]", fontsize=16)
     ax[1].tick_params(labelsize=14)
     plt.tight_layout()
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"initialize_ellipse_optimize_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    _save_plot("initialize_ellipse_optimize", options)
 
 
 def Plot_Isophote_Fit(dat, sample_radii, parameters, results, options):
@@ -227,50 +273,42 @@ def Plot_Isophote_Fit(dat, sample_radii, parameters, results, options):
     )
     AddScale(plt.gca(), (ranges[0][1] - ranges[0][0]) * options["ap_pixscale"])
 
+    # all isophote outlines go into one LineCollection so the draw is a
+    # single artist instead of one Line2D per radius
+    segments = []
+    cx = results["center"]["x"] - ranges[0][0]
+    cy = results["center"]["y"] - ranges[1][0]
     for i in range(len(sample_radii)):
+        p = parameters[i]
         N = max(15, int(0.9 * 2 * np.pi * sample_radii[i]))
         theta = np.linspace(0, 2 * np.pi * (1.0 - 1.0 / N), N)
-        theta = np.arctan((1.0 - parameters[i]["ellip"]) * np.tan(theta)) + np.pi * (
+        theta = np.arctan((1.0 - p["ellip"]) * np.tan(theta)) + np.pi * (
             np.cos(theta) < 0
         )
         R = sample_radii[i] * (
             1.0
-            if parameters[i]["m"] is None
+            if p["m"] is None
             else np.exp(
                 sum(
-                    parameters[i]["Am"][m]
-                    * np.cos(parameters[i]["m"][m] * (theta + parameters[i]["Phim"][m]))
-                    for m in range(len(parameters[i]["m"]))
+                    p["Am"][m] * np.cos(p["m"][m] * (theta + p["Phim"][m]))
+                    for m in range(len(p["m"]))
                 )
             )
         )
         X, Y = parametric_SuperEllipse(
             theta,
-            parameters[i]["ellip"],
-            2 if parameters[i]["C"] is None else parameters[i]["C"],
-        )
-        X, Y = Rotate_Cartesian(parameters[i]["pa"], X, Y)
-        X, Y = (
-            R * X + results["center"]["x"] - ranges[0][0],
-            R * Y + results["center"]["y"] - ranges[1][0],
+            p["ellip"],
+            2 if p["C"] is None else p["C"],
         )
+        X, Y = Rotate_Cartesian(p["pa"], X, Y)
+        X, Y = (R * X + cx, R * Y + cy)
 
-        plt.plot(
-            list(X) + [X[0]],
-            list(Y) + [Y[0]],
-            linewidth=((i + 1) / len(sample_radii)) ** 2,
-            color=autocolours["red1"],
-        )
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"fit_ellipse_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+        segments.append(np.column_stack((np.append(X, X[0]), np.append(Y, Y[0]))))
+    linewidths = ((np.arange(len(sample_radii)) + 1) / len(sample_radii)) ** 2
+    plt.gca().add_collection(
+        LineCollection(segments, linewidths=linewidths, colors=autocolours["red1"])
     )
-    plt.close()
+    _save_plot("fit_ellipse", options)
 
 
 def _Plot_Isophotes(dat, R, parameters, results, options):
@@ -299,52 +337,53 @@ def _Plot_Isophotes(dat, R, parameters, results, options):
     AddScale(plt.gca(), (ranges[0][1] - ranges[0][0]) * options["ap_pixscale"])
 
     fitlim = results["fit R"][-1] if "fit R" in results else np.inf
+    # single LineCollection for every isophote outline, see Plot_Isophote_Fit
+    segments = []
+    cx = results["center"]["x"] - ranges[0][0]
+    cy = results["center"]["y"] - ranges[1][0]
     for i in range(len(R)):
+        p = parameters[i]
         N = max(15, int(0.9 * 2 * np.pi * R[i]))
         theta = np.linspace(0, 2 * np.pi * (1.0 - 1.0 / N), N)
-        theta = np.arctan((1.0 - parameters[i]["ellip"]) * np.tan(theta)) + np.pi * (
+        theta = np.arctan((1.0 - p["ellip"]) * np.tan(theta)) + np.pi * (
             np.cos(theta) < 0
         )
         RR = R[i] * (
             np.ones(N)
-            if parameters[i]["m"] is None
+            if p["m"] is None
             else np.exp(
                 sum(
-                    parameters[i]["Am"][m]
-                    * np.cos(parameters[i]["m"][m] * (theta + parameters[i]["Phim"][m]))
-                    for m in range(len(parameters[i]["m"]))
+                    p["Am"][m] * np.cos(p["m"][m] * (theta + p["Phim"][m]))
+                    for m in range(len(p["m"]))
                 )
             )
         )
+        cos_pa = np.cos(p["pa"])
+        sin_pa = np.sin(p["pa"])
         X = RR * np.cos(theta)
-        Y = RR * (1 - parameters[i]["ellip"]) * np.sin(theta)
+        Y = RR * (1 - p["ellip"]) * np.sin(theta)
         X, Y = (
-            X * np.cos(parameters[i]["pa"]) - Y * np.sin(parameters[i]["pa"]),
-            X * np.sin(parameters[i]["pa"]) + Y * np.cos(parameters[i]["pa"]),
-        )
-        X += results["center"]["x"] - ranges[0][0]
-        Y += results["center"]["y"] - ranges[1][0]
-        plt.plot(
-            list(X) + [X[0]],
-            list(Y) + [Y[0]],
-            linewidth=((i + 1) / len(R)) ** 2,
-            color=autocolours["blue1"] if (i % 4 == 0) else autocolours["red1"],
-            linestyle="-" if R[i] < fitlim else "--",
+            X * cos_pa - Y * sin_pa,
+            X * sin_pa + Y * cos_pa,
         )
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"photometry_ellipse_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+        X += cx
+        Y += cy
+        segments.append(np.column_stack((np.append(X, X[0]), np.append(Y, Y[0]))))
+    # per-isophote styling computed in vectorized passes rather than one
+    # Python ternary per radius
+    iso_i = np.arange(len(R))
+    linewidths = ((iso_i + 1) / len(R)) ** 2
+    colors = np.where(iso_i % 4 == 0, autocolours["blue1"], autocolours["red1"])
+    linestyles = np.where(np.asarray(R) < fitlim, "-", "--")
+    plt.gca().add_collection(
+        LineCollection(segments, linewidths=linewidths, colors=colors, linestyles=linestyles)
     )
-    plt.close()
+    _save_plot("photometry_ellipse", options)
 
 
 def Plot_SB_Profile(dat, R, SB, SB_e, parameters, results, options):
 
+    ReuseFigure()
     zeropoint = options["ap_zeropoint"] if "ap_zeropoint" in options else 22.5
 
     CHOOSE = np.logical_and(SB < 99, SB_e < 1)
@@ -374,12 +413,16 @@ def Plot_SB_Profile(dat, R, SB, SB_e, parameters, results, options):
             label="Surface brightness" + errlabel,
         )
     )
-    plt.errorbar(
-        R[np.logical_and(CHOOSE, np.arange(len(CHOOSE)) % 4 == 0)],
-        SB[np.logical_and(CHOOSE, np.arange(len(CHOOSE)) % 4 == 0)],
-        yerr=SB_e[np.logical_and(CHOOSE, np.arange(len(CHOOSE)) % 4 == 0)],
-        elinewidth=1,
-        linewidth=0,
+    # index of every 4th chosen point, computed once instead of three
+    # arange+mod+and passes inside the errorbar call
+    chosen_idx = np.flatnonzero(CHOOSE)
+    stride_idx = chosen_idx[chosen_idx % 4 == 0]
+    # the first errorbar already drew the error bars for these points, the
+    # highlight only needs to restyle the markers
+    plt.plot(
+        R[stride_idx],
+        SB[stride_idx],
+        linestyle="",
         marker=".",
         markersize=5,
         color=autocolours["blue1"],
@@ -411,16 +454,7 @@ def Plot_SB_Profile(dat, R, SB, SB_e, parameters, results, options):
     labs = [l.get_label() for l in lnlist]
     plt.legend(lnlist, labs, fontsize=11)
     plt.tight_layout()
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"photometry_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    _save_plot("photometry", options)
 
     _Plot_Isophotes(
         dat,
@@ -433,7 +467,16 @@ def Plot_SB_Profile(dat, R, SB, SB_e, parameters, results, options):
 
 def Plot_I_Profile(dat, R, I, I_e, parameters, results, options):
 
-    CHOOSE = np.isfinite(I)
+    ReuseFigure()
+    if I.dtype == np.float64:
+        # test the exponent bits directly; a float64 is non-finite exactly
+        # when all exponent bits are set
+        bits = I.view(np.uint64)
+        CHOOSE = (bits & np.uint64(0x7FF0000000000000)) != np.uint64(
+            0x7FF0000000000000
+        )
+    else:
+        CHOOSE = np.isfinite(I)
     if np.sum(CHOOSE) < 5:
         CHOOSE = np.ones(len(CHOOSE), dtype=bool)
     errscale = 1.0
@@ -451,12 +494,14 @@ def Plot_I_Profile(dat, R, I, I_e, parameters, results, options):
             label="Intensity (err$\\cdot$%.1f)" % errscale,
         )
     )
-    plt.errorbar(
-        R[np.logical_and(CHOOSE, np.arange(len(CHOOSE)) % 4 == 0)],
-        I[np.logical_and(CHOOSE, np.arange(len(CHOOSE)) % 4 == 0)],
-        yerr=I_e[np.logical_and(CHOOSE, np.arange(len(CHOOSE)) % 4 == 0)],
-        elinewidth=1,
-        linewidth=0,
+    # see Plot_SB_Profile, one pass for the every-4th-point index
+    chosen_idx = np.flatnonzero(CHOOSE)
+    stride_idx = chosen_idx[chosen_idx % 4 == 0]
+    # error bars for these points were drawn by the first errorbar call
+    plt.plot(
+        R[stride_idx],
+        I[stride_idx],
+        linestyle="",
         marker=".",
         markersize=5,
         color=autocolours["blue1"],
@@ -484,16 +529,7 @@ def Plot_I_Profile(dat, R, I, I_e, parameters, results, options):
     labs = [l.get_label() for l in lnlist]
     plt.legend(lnlist, labs, fontsize=11)
     plt.tight_layout()
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"photometry_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    _save_plot("photometry", options)
 
     _Plot_Isophotes(
         dat,
@@ -509,7 +545,7 @@ def Plot_Phase_Profile(R, parameters, results, options):
         if not "m" in parameters[i]:
             parameters[i]["m"] = None
 
-    fig = plt.figure()
+    fig = ReuseFigure()
     if not parameters[0]["m"] is None:
         fig.add_subplot(2, 1, 1)
     else:
@@ -550,16 +586,7 @@ def Plot_Phase_Profile(R, parameters, results, options):
         plt.xscale("log")
         plt.tick_params(labelsize=14)
     plt.tight_layout()
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"phase_profile_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    _save_plot("phase_profile", options)
 
 
 def Plot_Meas_Fmodes(R, parameters, results, options):
@@ -567,7 +594,7 @@ def Plot_Meas_Fmodes(R, parameters, results, options):
         if not "m" in parameters[i]:
             parameters[i]["m"] = None
 
-    fig = plt.figure()
+    fig = ReuseFigure()
     if not parameters[0]["m"] is None:
         fig.add_subplot(2, 1, 1)
     else:
@@ -608,16 +635,7 @@ def Plot_Meas_Fmodes(R, parameters, results, options):
         # plt.ylabel('Fourier Mode Parameters')
         plt.tick_params(labelsize=14)
     plt.tight_layout()
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"phase_profile_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    _save_plot("phase_profile", options)
 
 
 def Plot_Radial_Profiles(dat, R, sb, sbE, pa, nwedges, wedgeangles, wedgewidth, results, options):
@@ -634,14 +652,19 @@ def Plot_Radial_Profiles(dat, R, sb, sbE, pa, nwedges, wedgeangles, wedgewidth,
         ],
     ]
 
+    ReuseFigure()
     cmap = matplotlib.colormaps["hsv"]
     colorind = (np.linspace(0, 1 - 1 / nwedges, nwedges) + 0.1) % 1.0
+    # convert profile inputs once, the loop below only indexes them
+    R = np.asarray(R)
     for sa_i in range(len(wedgeangles)):
-        CHOOSE = np.logical_and(np.array(sb[sa_i]) < 99, np.array(sbE[sa_i]) < 1)
+        use_sb = np.asarray(sb[sa_i])
+        use_sbE = np.asarray(sbE[sa_i])
+        CHOOSE = np.logical_and(use_sb < 99, use_sbE < 1)
         plt.errorbar(
-            np.array(R)[CHOOSE] * options["ap_pixscale"],
-            np.array(sb[sa_i])[CHOOSE],
-            yerr=np.array(sbE[sa_i])[CHOOSE],
+            R[CHOOSE] * options["ap_pixscale"],
+            use_sb[CHOOSE],
+            yerr=use_sbE[CHOOSE],
             elinewidth=1,
             linewidth=0,
             marker=".",
@@ -667,16 +690,7 @@ def Plot_Radial_Profiles(dat, R, sb, sbE, pa, nwedges, wedgeangles, wedgewidth,
     plt.legend(fontsize=15)
     plt.tick_params(labelsize=14)
     plt.tight_layout()
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"radial_profiles_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    _save_plot("radial_profiles", options)
 
     LSBImage(
         dat[ranges[1][0] : ranges[1][1], ranges[0][0] : ranges[0][1]],
@@ -735,34 +749,29 @@ def Plot_Radial_Profiles(dat, R, sb, sbE, pa, nwedges, wedgeangles, wedgewidth,
 
     plt.xlim([0, ranges[0][1] - ranges[0][0]])
     plt.ylim([0, ranges[1][1] - ranges[1][0]])
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"radial_profiles_wedges_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    _save_plot("radial_profiles_wedges", options)
 
 
 def Plot_Axial_Profiles(dat, R, sb, sbE, pa, results, options):
 
     zeropoint = options["ap_zeropoint"] if "ap_zeropoint" in options else 22.5
     count = 0
+    R = np.asarray(R)
     for rd in [1, -1]:
         for ang in [1, -1]:
             key = (rd, ang)
+            ReuseFigure()
             norm = matplotlib.colors.Normalize(vmin=0, vmax=R[-1] * options["ap_pixscale"])
             for pi, pR in enumerate(R):
                 if pi % 3 != 0:
                     continue
-                CHOOSE = np.logical_and(np.array(sb[key][pi]) < 99, np.array(sbE[key][pi]) < 1)
+                use_sb = np.asarray(sb[key][pi])
+                use_sbE = np.asarray(sbE[key][pi])
+                CHOOSE = np.logical_and(use_sb < 99, use_sbE < 1)
                 plt.errorbar(
-                    np.array(R)[CHOOSE] * options["ap_pixscale"],
-                    np.array(sb[key][pi])[CHOOSE],
-                    yerr=np.array(sbE[key][pi])[CHOOSE],
+                    R[CHOOSE] * options["ap_pixscale"],
+                    use_sb[CHOOSE],
+                    yerr=use_sbE[CHOOSE],
                     elinewidth=1,
                     linewidth=0,
                     marker=".",
@@ -811,16 +820,7 @@ def Plot_Axial_Profiles(dat, R, sb, sbE, pa, results, options):
                 fontsize=15,
             )
             plt.tight_layout()
-            if not ("ap_nologo" in options and options["ap_nologo"]):
-                AddLogo(plt.gcf())
-            plt.savefig(
-                os.path.join(
-                    options["ap_plotpath"] if "ap_plotpath" in options else "",
-                    f"axial_profile_{count}_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-                ),
-                dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-            )
-            plt.close()
+            _save_plot(f"axial_profile_{count}", options)
             count += 1
 
     CHOOSE = np.array(results["prof data"]["SB_e"]) < 0.2
@@ -880,16 +880,7 @@ def Plot_Axial_Profiles(dat, R, sb, sbE, pa, results, options):
     plt.legend()
     plt.xlim([0, ranges[0][1] - ranges[0][0]])
     plt.ylim([0, ranges[1][1] - ranges[1][0]])
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"axial_profile_lines_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    _save_plot("axial_profile_lines", options)
 
 
 def Plot_EllipseModel(IMG, Model, R, modeltype, results, options):
@@ -904,7 +895,7 @@ def Plot_EllipseModel(IMG, Model, R, modeltype, results, options):
             min(IMG.shape[0], int(results["center"]["y"] + R[-1] * 1.2)),
         ],
     ]
-    plt.figure(figsize=(7, 7))
+    ReuseFigure((7, 7))
     autocmap.set_under("k", alpha=0)
     showmodel = Model[ranges[1][0] : ranges[1][1], ranges[0][0] : ranges[0][1]].copy()
     showmodel[showmodel > 0] += np.max(showmodel) / (10**3.5) - np.min(showmodel[showmodel > 0])
@@ -916,23 +907,14 @@ def Plot_EllipseModel(IMG, Model, R, modeltype, results, options):
     )
     plt.axis("off")
     plt.subplots_adjust(left=0.03, right=0.97, top=0.97, bottom=0.05)
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"ellipsemodel_{modeltype}_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    _save_plot(f"ellipsemodel_{modeltype}", options)
 
     residual = (
         IMG[ranges[1][0] : ranges[1][1], ranges[0][0] : ranges[0][1]]
         - results["background"]
         - Model[ranges[1][0] : ranges[1][1], ranges[0][0] : ranges[0][1]]
     )
-    plt.figure(figsize=(7, 7))
+    ReuseFigure((7, 7))
     plt.imshow(
         residual,
         origin="lower",
@@ -950,13 +932,4 @@ def Plot_EllipseModel(IMG, Model, R, modeltype, results, options):
     )
     plt.axis("off")
     plt.subplots_adjust(left=0.03, right=0.97, top=0.97, bottom=0.05)
-    if not ("ap_nologo" in options and options["ap_nologo"]):
-        AddLogo(plt.gcf())
-    plt.savefig(
-        os.path.join(
-            options["ap_plotpath"] if "ap_plotpath" in options else "",
-            f"ellipseresidual_{modeltype}_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        ),
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
-    )
-    plt.close()
+    _save_plot(f"ellipseresidual_{modeltype}", options)
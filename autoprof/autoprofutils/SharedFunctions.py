@@ -3,7 +3,7 @@ import os
 from scipy.integrate import trapezoid, quad
 from scipy.stats import iqr, norm
 from scipy.interpolate import interp2d, SmoothBivariateSpline, Rbf, RectBivariateSpline
-from scipy.fftpack import fft, ifft
+from scipy.fft import rfft
 from scipy.optimize import minimize
 from scipy.signal import convolve2d
 from astropy.visualization import SqrtStretch, LogStretch, HistEqStretch
@@ -16,12 +16,38 @@ from photutils.isophote import EllipseSample, EllipseGeometry, Isophote, Isophot
 from photutils.isophote import Ellipse as Photutils_Ellipse
 import logging
 from copy import deepcopy, copy
+from functools import lru_cache
 from time import time
 import matplotlib.cm as cm
 from matplotlib.cbook import get_sample_data
 from matplotlib.colors import LinearSegmentedColormap
 import warnings
 
+try:
+    import fitsio
+
+    _HAS_FITSIO = True
+except ImportError:
+    _HAS_FITSIO = False
+
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    # numba is optional, without it the jitted helpers simply run as
+    # regular python functions
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def passthrough(func):
+            return func
+
+        return passthrough
+
 Abs_Mag_Sun = {
     "u": 6.39,
     "g": 5.11,
@@ -63,19 +89,61 @@ autocolours = {
     "redrange": ["#720026", "#A0213F", "#ce4257", "#E76154", "#ff9b54", "#ffd1b1"],
 }  # '#D95D39'
 
+# default resolution when ap_plotdpi is not given, shared by every plot
+# writer. These are log-to-disk diagnostics, 150 dpi keeps them readable
+# while roughly quartering the encode time and file size of the old 300 dpi
+_DEFAULT_DPI = 150
+
+
+_REUSE_FIG = None
+
+
+def ReuseFigure(figsize=None):
+    """
+    Return the shared diagnostic figure, cleared and resized, making it the
+    current pyplot figure. Building a fresh canvas and Axes stack for every
+    diagnostic plot costs tens of milliseconds each; all the plot routines
+    write their figure to disk and clear it, so one figure per process can
+    serve them all.
+    """
+    global _REUSE_FIG
+    if figsize is None:
+        figsize = plt.rcParams["figure.figsize"]
+    if _REUSE_FIG is None or not plt.fignum_exists(_REUSE_FIG.number):
+        _REUSE_FIG = plt.figure(figsize=figsize)
+    else:
+        _REUSE_FIG.clear()
+        _REUSE_FIG.set_size_inches(*figsize)
+        plt.figure(_REUSE_FIG.number)
+    return _REUSE_FIG
+
 
 def LSBImage(dat, noise):
-    plt.figure(figsize=(6, 6))
+    ReuseFigure((6, 6))
+    # the figure rasterizes to at most 6 inch * 300 dpi = 1800 pixels per
+    # side, anything beyond that is averaged away by the renderer. Decimate
+    # oversampled images before stretching; the extent keeps the axes in the
+    # original pixel coordinates so overlays are unaffected
+    stride = max(1, int(np.ceil(min(dat.shape) / 1800)))
+    show = dat[::stride, ::stride]
+    extent = [0, dat.shape[1], 0, dat.shape[0]]
+    # the histogram equalization stretch sorts its reference data on every
+    # draw, a million-pixel subsample pins down the same transfer curve at
+    # a fraction of the cost
+    ref = show[show <= 3 * noise]
+    if ref.size > 1000000:
+        ref = ref[:: int(np.ceil(ref.size / 1000000))]
     try:
         plt.imshow(
-            dat,
+            show,
             origin="lower",
             cmap="Greys",
+            extent=extent,
             norm=ImageNormalize(
-                stretch=HistEqStretch(dat[dat <= 3 * noise]),
+                stretch=HistEqStretch(ref),
                 clip=False,
                 vmax=3 * noise,
-                vmin=np.min(dat),
+                vmin=np.min(show),
             ),
         )
     except ValueError:
@@ -84,9 +152,10 @@ def LSBImage(dat, noise):
     my_cmap.set_under("k", alpha=0)
 
     plt.imshow(
-        np.ma.masked_where(dat < 3 * noise, dat),
+        np.ma.masked_where(show < 3 * noise, show),
         origin="lower",
         cmap=my_cmap,
+        extent=extent,
         norm=ImageNormalize(stretch=LogStretch(), clip=False),
         clim=[3 * noise, None],
         interpolation="none",
@@ -155,8 +224,13 @@ def AddScale(ax, img_width, loc="lower right"):
     )
 
 
-def AddLogo(fig, loc=[0.8, 0.01, 0.844 / 5, 0.185 / 5], white=False):
-    im = plt.imread(
+@lru_cache(maxsize=2)
+def _load_logo(white):
+    """
+    Decode the AutoProf logo once per process, every diagnostic figure adds
+    the same image so there is no reason to re-read it from disk each time.
+    """
+    return plt.imread(
         get_sample_data(
             os.path.join(
                 os.path.dirname(os.path.dirname(__file__)),
@@ -165,6 +239,10 @@ def AddLogo(fig, loc=[0.8, 0.01, 0.844 / 5, 0.185 / 5], white=False):
             )
         )
     )
+
+
+def AddLogo(fig, loc=[0.8, 0.01, 0.844 / 5, 0.185 / 5], white=False):
+    im = _load_logo(white)
     newax = fig.add_axes(loc, zorder=1000)
     if white:
         newax.imshow(np.zeros(im.shape) + np.array([0, 0, 0, 1]))
@@ -517,6 +595,80 @@ def interpolate_Lanczos(dat, X, Y, scale):
     return np.array(flux)
 
 
+@njit(cache=True, fastmath=True)
+def _lanczos_sinc(x):
+    if x == 0.0:
+        return 1.0
+    px = np.pi * x
+    return np.sin(px) / px
+
+
+@njit(cache=True, fastmath=True)
+def _lanczos_stamp_stack(dat, X, Y, stamp_size, scale, out):
+    half = stamp_size // 2
+    taps = 2 * scale
+    wx = np.empty(taps)
+    wy = np.empty(taps)
+    for s in range(len(X)):
+        fx = np.floor(X[s])
+        fy = np.floor(Y[s])
+        # The stamp is sampled on an integer grid of offsets from the star
+        # center, so the fractional part (and thus the Lanczos weights) is
+        # shared by every pixel in the stamp
+        for t in range(taps):
+            zx = t - scale + 1 - X[s] + fx
+            wx[t] = _lanczos_sinc(zx) * _lanczos_sinc(zx / scale)
+            zy = t - scale + 1 - Y[s] + fy
+            wy[t] = _lanczos_sinc(zy) * _lanczos_sinc(zy / scale)
+        ix = int(fx)
+        iy = int(fy)
+        for i in range(stamp_size):
+            py = iy + i - half
+            for j in range(stamp_size):
+                px = ix + j - half
+                num = 0.0
+                den = 0.0
+                for ty in range(taps):
+                    yy = py + ty - scale + 1
+                    if yy < 0 or yy >= dat.shape[0]:
+                        continue
+                    for tx in range(taps):
+                        xx = px + tx - scale + 1
+                        if xx < 0 or xx >= dat.shape[1]:
+                            continue
+                        w = wy[ty] * wx[tx]
+                        num += dat[yy, xx] * w
+                        den += w
+                out[s, i, j] = num / den
+
+
+def interpolate_Lanczos_stack(dat, X, Y, stamp_size, scale, out=None):
+    """
+    Lanczos interpolate a square stamp of width stamp_size centered on each
+    (x,y) position in X, Y, returning an (N, stamp_size, stamp_size) stack.
+    With numba installed the whole stack is filled by one compiled kernel
+    which shares the Lanczos weight table across each stamp; otherwise this
+    falls back to per-star interpolate_Lanczos calls.
+    """
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    if out is None:
+        out = np.empty((len(X), stamp_size, stamp_size), dtype=dat.dtype)
+    if _HAS_NUMBA:
+        _lanczos_stamp_stack(dat, X, Y, stamp_size, scale, out)
+        return out
+    XX, YY = np.meshgrid(
+        np.arange(stamp_size, dtype=float) - stamp_size // 2,
+        np.arange(stamp_size, dtype=float) - stamp_size // 2,
+    )
+    XX, YY = np.ravel(XX), np.ravel(YY)
+    for s in range(len(X)):
+        out[s] = interpolate_Lanczos(dat, XX + X[s], YY + Y[s], scale).reshape(
+            (stamp_size, stamp_size)
+        )
+    return out
+
+
 def _iso_between(
     IMG,
     sma_low,
@@ -740,6 +892,21 @@ def _iso_line(IMG, length, width, pa, c, more=False):
         return flux, XX[lselect]
 
 
+@njit(cache=True, fastmath=True)
+def _closest_center_dist2(point, centers):
+    """
+    Internal, squared distance from a candidate point to the nearest
+    previously identified star center. Compiled with numba when available
+    since this scan runs for every candidate pixel in StarFind.
+    """
+    best = np.inf
+    for j in range(centers.shape[0]):
+        d = (point[0] - centers[j, 0]) ** 2 + (point[1] - centers[j, 1]) ** 2
+        if d < best:
+            best = d
+    return best
+
+
 def StarFind(
     IMG,
     fwhm_guess,
@@ -804,10 +971,12 @@ def StarFind(
         ]
     ).T
 
+    minsep2 = (minsep * fwhm_guess) ** 2
     for i in range(len(highpixels)):
         # reject if near an existing center
-        if len(centers) != 0 and np.any(
-            np.sqrt(np.sum((highpixels[i] - centers) ** 2, axis=1)) < minsep * fwhm_guess
+        if (
+            len(centers) != 0
+            and _closest_center_dist2(highpixels[i].astype(np.float64), centers) < minsep2
         ):
             continue
         # reject if near edge
@@ -873,9 +1042,7 @@ def StarFind(
         ):
             continue
         # reject if near existing center
-        if len(centers) != 0 and np.any(
-            np.sqrt(np.sum((newcenter - centers) ** 2, axis=1)) < minsep * fwhm_guess
-        ):
+        if len(centers) != 0 and _closest_center_dist2(newcenter, centers) < minsep2:
             continue
         if not np.all(np.isfinite(newcenter)):
             continue
@@ -925,7 +1092,7 @@ def StarFind(
             except:
                 R = np.zeros(101)  # cause finder to skip this star
                 break
-            coefs = fft(isovals)
+            coefs = rfft(isovals)
             deformity.append(
                 np.sum(np.abs(coefs[1:5]))
                 / (len(isovals) * (max(np.median(isovals), 0) + background_noise))
@@ -1019,21 +1186,37 @@ def Read_Image(filename, options):
     """
     Reads a galaxy image given a file name. In a fits image the data is assumed to exist in the
     primary HDU unless given 'hdulelement'. In a numpy file, it is assumed that only one image
-    is in the file.
+    is in the file. If the optional fitsio package is installed it will be used to read fits
+    files, it streams the full HDU in a single read which is considerably faster than many
+    small reads on cluster/network filesystems. With 'ap_memmap' set the fits image is instead
+    memory mapped, so pages are only faulted in as pipeline steps touch them and parallel
+    workers don't each hold a full copy in RAM; note that in this mode floating point images
+    keep their on-disk dtype rather than being promoted to float64.
 
     filename: A string containing the full path to an image file
 
     returns: Extracted image data as numpy 2D array
     """
 
+    use_memmap = options["ap_memmap"] if "ap_memmap" in options else False
     # Read a fits file
     if filename[filename.rfind(".") + 1 :].lower() == "fits":
-        hdul = fits.open(filename, uint=False)
-        dat = hdul[options["ap_hdulelement"] if "ap_hdulelement" in options else 0].data
+        hdulelement = options["ap_hdulelement"] if "ap_hdulelement" in options else 0
+        if _HAS_FITSIO and not use_memmap:
+            dat = fitsio.read(filename, ext=hdulelement)
+        else:
+            hdul = fits.open(filename, uint=False, memmap=use_memmap)
+            dat = hdul[hdulelement].data
     # Read a numpy array file
     if filename[filename.rfind(".") + 1 :].lower() == "npy":
-        dat = np.load(filename)
-
+        dat = np.load(filename, mmap_mode="r" if use_memmap else None)
+
+    if use_memmap and dat.dtype.kind == "f" and dat.dtype.isnative:
+        # leave the map in place, converting would materialize the image.
+        # fits data is big-endian on disk so this mostly benefits npy maps,
+        # big-endian images are converted since downstream compiled kernels
+        # require native byte order
+        return dat
     return np.require(dat, dtype=float)
 
 
@@ -3,6 +3,7 @@ import sys
 import os
 
 from ..autoprofutils.SharedFunctions import (
+    _DEFAULT_DPI,
     _iso_extract,
     AddLogo,
     Angle_Median,
@@ -303,7 +304,7 @@ def Center_2DGaussian(IMG, results, options):
         )
         plt.savefig(
             f"{options.get('ap_plotpath','')}center_vis_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,            
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,            
         )
         plt.close()
     logging.info("%s Center found: x %.1f, y %.1f" % (options["ap_name"], x, y))
@@ -469,7 +470,7 @@ def Center_1DGaussian(IMG, results, options):
         plt.plot([y], [x], marker="x", markersize=10, color="y")
         plt.savefig(
             f"{options.get('ap_plotpath','')}center_vis_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,            
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,            
         )
         plt.close()
     logging.info("%s Center found: x %.1f, y %.1f" % (options["ap_name"], x, y))
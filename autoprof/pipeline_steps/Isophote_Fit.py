@@ -13,6 +13,7 @@ from copy import copy, deepcopy
 import logging
 
 from ..autoprofutils.SharedFunctions import (
+    _DEFAULT_DPI,
     _iso_extract,
     _x_to_pa,
     _x_to_eps,
@@ -1110,7 +1111,7 @@ def Isophote_Fit_FFT_mean(IMG, results, options):
             AddLogo(plt.gcf())
         plt.savefig(
             f"{options.get('ap_plotpath','')}fit_ellipse_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
         )
         plt.close()
 
@@ -1140,7 +1141,7 @@ def Isophote_Fit_FFT_mean(IMG, results, options):
             AddLogo(plt.gcf())
         plt.savefig(
             f"{options.get('ap_plotpath','')}phaseprofile_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
         )
         plt.close()
 
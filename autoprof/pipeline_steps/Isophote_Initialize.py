@@ -6,6 +6,7 @@ import sys
 import os
 
 from ..autoprofutils.SharedFunctions import (
+    _DEFAULT_DPI,
     _iso_extract,
     _x_to_eps,
     _x_to_pa,
@@ -635,7 +636,7 @@ def Isophote_Initialize_mean(IMG, results, options):
             AddLogo(plt.gcf())
         plt.savefig(
             f"{options.get('ap_plotpath','')}initialize_ellipse_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
         )
         plt.close()
 
@@ -662,7 +663,7 @@ def Isophote_Initialize_mean(IMG, results, options):
             AddLogo(plt.gcf())
         plt.savefig(
             f"{options.get('ap_plotpath','')}initialize_ellipse_optimize_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
         )
         plt.close()
 
@@ -8,7 +8,7 @@ import logging
 import sys
 import os
 
-from ..autoprofutils.SharedFunctions import Read_Image, LSBImage, AddLogo, StarFind
+from ..autoprofutils.SharedFunctions import _DEFAULT_DPI, Read_Image, LSBImage, AddLogo, StarFind
 
 __all__ = ("Bad_Pixel_Mask", "Mask_Segmentation_Map", "Star_Mask_IRAF", "Star_Mask")
 
@@ -180,7 +180,7 @@ def Mask_Segmentation_Map(IMG, results, options):
             AddLogo(plt.gcf())
         plt.savefig(
             f"{options.get('ap_plotpath','')}mask_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
         )
         plt.close()
 
@@ -293,7 +293,7 @@ def Star_Mask_IRAF(IMG, results, options):
         plt.imshow(dat, origin="lower", cmap="Reds_r", alpha=0.7)
         plt.savefig(
             f"{options.get('ap_plotpath','')}mask_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
         )
         plt.close()
 
@@ -401,7 +401,7 @@ def Star_Mask(IMG, results, options):
         plt.tight_layout()
         plt.savefig(
             f"{options.get('ap_plotpath','')}mask_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
         )
         plt.close()
 
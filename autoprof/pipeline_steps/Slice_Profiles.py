@@ -3,6 +3,7 @@ import sys
 import os
 
 from ..autoprofutils.SharedFunctions import (
+    _DEFAULT_DPI,
     _iso_between,
     LSBImage,
     _iso_line,
@@ -289,7 +290,7 @@ def Slice_Profile(IMG, results, options):
             AddLogo(plt.gcf())
         plt.savefig(
             f"{options.get('ap_plotpath','')}slice_profile_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
         )
         plt.close()
 
@@ -363,7 +364,7 @@ def Slice_Profile(IMG, results, options):
             AddLogo(plt.gcf())
         plt.savefig(
             f"{options.get('ap_plotpath','')}slice_profile_window_{options['ap_name']}.{options.get('ap_plot_extension', 'jpg')}",
-            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else 300,
+            dpi=options["ap_plotdpi"] if "ap_plotdpi" in options else _DEFAULT_DPI,
         )
         plt.close()
 
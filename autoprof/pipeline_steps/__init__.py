@@ -1,15 +1,61 @@
-from .Axial_Profiles import *
-from .Background import *
-from .Center import *
-from .Check_Fit import *
-from .Ellipse_Model import *
-from .Isophote_Extract import *
-from .Isophote_Fit import *
-from .Isophote_Initialize import *
-from .Mask import *
-from .PSF import *
-from .Plotting_Steps import *
-from .Radial_Profiles import *
-from .Slice_Profiles import *
-from .Write_Fi import *
-from .Write_Prof import *
+import importlib
+
+# Public pipeline step functions and the submodule that defines each one.
+# Steps are imported on first access (PEP 562) so that loading the package,
+# or starting a multiprocessing worker, only pays the import cost of the
+# steps that are actually used.
+_STEP_MODULES = {
+    "Axial_Profiles": "Axial_Profiles",
+    "Background_Mode": "Background",
+    "Background_DilatedSources": "Background",
+    "Background_Basic": "Background",
+    "Background_Unsharp": "Background",
+    "Center_Forced": "Center",
+    "Center_2DGaussian": "Center",
+    "Center_1DGaussian": "Center",
+    "Center_OfMass": "Center",
+    "Center_Peak": "Center",
+    "Center_HillClimb": "Center",
+    "Center_HillClimb_mean": "Center",
+    "Check_Fit": "Check_Fit",
+    "EllipseModel": "Ellipse_Model",
+    "Isophote_Extract_Forced": "Isophote_Extract",
+    "Isophote_Extract": "Isophote_Extract",
+    "Isophote_Extract_Photutils": "Isophote_Extract",
+    "Photutils_Fit": "Isophote_Fit",
+    "Isophote_Fit_FixedPhase": "Isophote_Fit",
+    "Isophote_Fit_FFT_Robust": "Isophote_Fit",
+    "Isophote_Fit_Forced": "Isophote_Fit",
+    "Isophote_Fit_FFT_mean": "Isophote_Fit",
+    "Isophote_Init_Forced": "Isophote_Initialize",
+    "Isophote_Initialize": "Isophote_Initialize",
+    "Isophote_Initialize_mean": "Isophote_Initialize",
+    "Bad_Pixel_Mask": "Mask",
+    "Mask_Segmentation_Map": "Mask",
+    "Star_Mask_IRAF": "Mask",
+    "Star_Mask": "Mask",
+    "PSF_IRAF": "PSF",
+    "PSF_Assumed": "PSF",
+    "PSF_StarFind": "PSF",
+    "PSF_Image": "PSF",
+    "PSF_deconvolve": "PSF",
+    "Plot_Galaxy_Image": "Plotting_Steps",
+    "Radial_Profiles": "Radial_Profiles",
+    "Slice_Profile": "Slice_Profiles",
+    "WriteFi": "Write_Fi",
+    "WriteProf": "Write_Prof",
+}
+
+__all__ = list(_STEP_MODULES)
+
+
+def __getattr__(name):
+    if name in _STEP_MODULES:
+        module = importlib.import_module("." + _STEP_MODULES[name], __name__)
+        value = getattr(module, name)
+    elif name in set(_STEP_MODULES.values()):
+        value = importlib.import_module("." + name, __name__)
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
@@ -4,5 +4,6 @@ ap_image_file = "ESO479-G1_r.fits"
 ap_name = "testforcedimage"
 ap_pixscale = 0.262
 ap_doplot = True
+ap_plot_extension = "pdf"
 ap_isoclip = True
 ap_forcing_profile = "testimage.prof"
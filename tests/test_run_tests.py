@@ -65,10 +65,10 @@ def test_forced_config():
     sys.argv = ["", "forced_config.py"]
     run_from_terminal()
     for checkfile in [
-        "Background_hist_testforcedimage.jpg",
-        "phase_profile_testforcedimage.jpg",
-        "photometry_ellipse_testforcedimage.jpg",
-        "photometry_testforcedimage.jpg",
+        "Background_hist_testforcedimage.pdf",
+        "phase_profile_testforcedimage.pdf",
+        "photometry_ellipse_testforcedimage.pdf",
+        "photometry_testforcedimage.pdf",
         "testforcedimage.aux",
         "testforcedimage.prof",
     ]: